@@ -1,5 +1,4 @@
 import asyncio
-import time
 from collections.abc import Awaitable
 from typing import Any, Callable, Optional, TypeVar
 
@@ -13,6 +12,32 @@ T = TypeVar('T')
 # Global configuration
 _global_config = RateLimitConfig()
 
+# Maximum retries for rate limited calls in execute() (so a failed call runs at
+# most 1 + MAX_RETRIES attempts)
+MAX_RETRIES = 3
+
+
+def _overrides(
+    max_requests: Optional[int],
+    time_window: Optional[int],
+    strategy: Optional[RateLimitStrategy],
+    burst_size: Optional[int],
+    burst_window: Optional[int],
+    cooldown_period: Optional[int],
+    extract_headers_callback: Optional[Callable[[Any], dict[str, str]]],
+) -> dict[str, Any]:
+    """Collect the non-None rate limit options into a model_copy update dict"""
+    pairs = (
+        ('max_requests', max_requests),
+        ('time_window', time_window),
+        ('strategy', strategy),
+        ('burst_size', burst_size),
+        ('burst_window', burst_window),
+        ('cooldown_period', cooldown_period),
+        ('extract_headers_callback', extract_headers_callback),
+    )
+    return {name: value for name, value in pairs if value is not None}
+
 
 def configure(
     max_requests: Optional[int] = None,
@@ -45,20 +70,19 @@ def configure(
     """
     global _global_config
 
-    if max_requests is not None:
-        _global_config.max_requests = max_requests
-    if time_window is not None:
-        _global_config.time_window = time_window
-    if strategy is not None:
-        _global_config.strategy = strategy
-    if burst_size is not None:
-        _global_config.burst_size = burst_size
-    if burst_window is not None:
-        _global_config.burst_window = burst_window
-    if cooldown_period is not None:
-        _global_config.cooldown_period = cooldown_period
-    if extract_headers_callback is not None:
-        _global_config.extract_headers_callback = extract_headers_callback
+    updates = _overrides(
+        max_requests,
+        time_window,
+        strategy,
+        burst_size,
+        burst_window,
+        cooldown_period,
+        extract_headers_callback,
+    )
+    if updates:
+        # Replace rather than mutate, so clients constructed earlier keep the
+        # config snapshot they were built from
+        _global_config = _global_config.model_copy(update=updates)
 
 
 class RateLimitedClient:
@@ -107,24 +131,18 @@ class RateLimitedClient:
             cooldown_period: Override default cooldown period
             extract_headers_callback: Custom function to extract headers from responses
         """
-        # Make a copy of the global config
-        config = _global_config.model_copy()
-
-        # Apply overrides
-        if max_requests is not None:
-            config.max_requests = max_requests
-        if time_window is not None:
-            config.time_window = time_window
-        if strategy is not None:
-            config.strategy = strategy
-        if burst_size is not None:
-            config.burst_size = burst_size
-        if burst_window is not None:
-            config.burst_window = burst_window
-        if cooldown_period is not None:
-            config.cooldown_period = cooldown_period
-        if extract_headers_callback is not None:
-            config.extract_headers_callback = extract_headers_callback
+        # Copy the global config with any overrides applied in one pass
+        config = _global_config.model_copy(
+            update=_overrides(
+                max_requests,
+                time_window,
+                strategy,
+                burst_size,
+                burst_window,
+                cooldown_period,
+                extract_headers_callback,
+            )
+        )
 
         self._limiter = RateLimiter(config)
 
@@ -153,20 +171,26 @@ class RateLimitedClient:
         Returns:
             The result of the function call
         """
-        max_retries = 3
-        retry_count = 0
+        # Hoisted so each attempt of the loop below reads locals instead of
+        # re-resolving module globals and the limiter attribute chain
+        _sleep = asyncio.sleep
+        _is_rate_limit_error = is_rate_limit_error
+        limiter = self._limiter
+        acquire = limiter.acquire
+
         last_error = None
 
-        while retry_count <= max_retries:  # Changed to <= to allow max_retries attempts
+        # The retry budget is fixed, so iterate it directly: 1 + MAX_RETRIES attempts
+        for attempt in range(MAX_RETRIES + 1):
             try:
                 # Acquire permission to make the request
-                await self._limiter.acquire()
+                await acquire()
 
                 # Call the function
                 result = await func(*args, **kwargs)
 
                 # Update rate limiter based on response
-                self.update_from_response(result)
+                limiter.update_from_response(result)
 
                 # Return the result
                 return result
@@ -176,16 +200,16 @@ class RateLimitedClient:
                 last_error = e
 
                 # Check if this is a rate limit error that we should retry
-                if is_rate_limit_error(e):
+                if _is_rate_limit_error(e):
                     # Update rate limiter based on error
-                    self.update_from_error(e)
+                    limiter.update_from_error(e)
 
-                    if retry_count < max_retries:  # Only retry if we haven't exceeded max_retries
-                        # Calculate wait time after updating the rate limiter
-                        wait_time = self._limiter.calculate_wait_time(time.time())
+                    if attempt < MAX_RETRIES:  # Only retry if attempts remain
+                        # Calculate wait time after updating the rate limiter (same
+                        # monotonic clock the limiter records timestamps with)
+                        wait_time = limiter.calculate_wait_time(limiter._now())
                         if wait_time > 0:
-                            await asyncio.sleep(wait_time)
-                        retry_count += 1
+                            await _sleep(wait_time)
                         continue
 
                 # If we get here, either it's not a rate limit error or we've exceeded max_retries
@@ -225,24 +249,18 @@ class RateLimitedClient:
         Returns:
             A new RateLimitedClient instance with the updated options
         """
-        # Get a copy of the current configuration
-        config = self._limiter.config.model_copy()
-
-        # Apply overrides
-        if max_requests is not None:
-            config.max_requests = max_requests
-        if time_window is not None:
-            config.time_window = time_window
-        if strategy is not None:
-            config.strategy = strategy
-        if burst_size is not None:
-            config.burst_size = burst_size
-        if burst_window is not None:
-            config.burst_window = burst_window
-        if cooldown_period is not None:
-            config.cooldown_period = cooldown_period
-        if extract_headers_callback is not None:
-            config.extract_headers_callback = extract_headers_callback
+        # Copy the current configuration with any overrides applied in one pass
+        config = self._limiter.config.model_copy(
+            update=_overrides(
+                max_requests,
+                time_window,
+                strategy,
+                burst_size,
+                burst_window,
+                cooldown_period,
+                extract_headers_callback,
+            )
+        )
 
         # Return a new RateLimitedClient with the new configuration
         return RateLimitedClient(
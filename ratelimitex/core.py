@@ -1,8 +1,10 @@
 import asyncio
 import logging
+import random
 import re
 import time
-from typing import Any, Optional
+from collections import deque
+from typing import Any, Callable, Optional
 
 from .models import (
     ADAPTIVE_BACKOFF_FACTOR,
@@ -18,28 +20,82 @@ from .models import (
 logger = logging.getLogger(__name__)
 
 # Common rate limit header patterns
-RATE_LIMIT_HEADERS = [
-    # Standard headers
+RATE_LIMIT_HEADERS: tuple[str, ...] = (
+    # Standard / Twitter-style headers
     'x-rate-limit-reset',
     'x-rate-limit-remaining',
     'x-rate-limit-limit',
     'x-rate-limit-seconds',
+    # GitHub-style
     'x-ratelimit-reset',
     'x-ratelimit-remaining',
     'x-ratelimit-limit',
-    # GitHub-style
-    'x-ratelimit-reset',
-    # Twitter-style
-    'x-rate-limit-reset',
     # AWS-style
     'x-amzn-ratelimit-limit',
     # Generic retry header
     'retry-after',
-]
+)
 
 # Regex to extract numeric values from headers
 HEADER_VALUE_PATTERN = re.compile(r'(\d+)')
 
+# Smoothing factor for the request-rate exponential moving average in get_stats
+RATE_EMA_ALPHA = 0.1
+
+# Sweep for idle keys once the per-key state table grows past this many entries
+IDLE_KEY_SWEEP_THRESHOLD = 1024
+
+# Regex for wait hints in error messages ("retry after 30", "try again in 30",
+# "reset in 30"). Case-insensitive so we scan the message once without lowering a copy.
+RETRY_AFTER_MESSAGE_PATTERN = re.compile(
+    r'(?:retry[- ]after|try again in|reset in)\s+(\d+)', re.IGNORECASE
+)
+
+
+def _parse_int(value: Any) -> Optional[int]:
+    """Parse an integer header value, falling back to a regex for malformed input.
+
+    Rate limit headers are overwhelmingly plain integer strings, so try the cheap
+    isdigit/int path first and only run the regex on the rare messy value.
+    """
+    text = value if isinstance(value, str) else str(value)
+    if text.isdigit():
+        return int(text)
+    match = HEADER_VALUE_PATTERN.search(text)
+    return int(match.group(1)) if match else None
+
+
+def _header_category(header: str) -> str:
+    """Classify a rate limit header name (mirrors the order of the parsing branches)."""
+    if 'reset' in header:
+        return 'reset'
+    if 'limit' in header and 'remaining' not in header:
+        return 'limit'
+    if 'remaining' in header:
+        return 'remaining'
+    return 'seconds'
+
+
+# Precomputed name -> category mapping so the hot parsing path is a single dict
+# lookup per incoming header instead of a substring-test scan over every known name.
+_HEADER_CATEGORY = {header: _header_category(header) for header in RATE_LIMIT_HEADERS}
+
+
+class _KeyState:
+    """Per-key limiter state: request window, burst window and accumulated wait.
+
+    All state for a key lives in one object so the hot path pays a single dict
+    lookup instead of probing three parallel dicts; __slots__ keeps each
+    instance to three references with no per-instance __dict__.
+    """
+
+    __slots__ = ('window', 'burst', 'wait_time')
+
+    def __init__(self, window_maxlen: int, burst_maxlen: int):
+        self.window: deque[float] = deque(maxlen=window_maxlen)
+        self.burst: deque[float] = deque(maxlen=burst_maxlen)
+        self.wait_time: float = 0.0
+
 
 class RateLimiter:
     """
@@ -50,12 +106,28 @@ class RateLimiter:
 
     def __init__(self, config: Optional[RateLimitConfig] = None):
         self.config = config or RateLimitConfig()
-        self.requests: dict[str, list[float]] = {}  # key -> list of request timestamps
-        self.burst_requests: dict[str, list[float]] = {}  # key -> list of burst request timestamps
-        self.wait_times: dict[str, float] = {}  # key -> total wait time
-        self._lock = asyncio.Lock()
-
-        # Statistics
+        # All per-key bookkeeping lives in a single dict of _KeyState objects.
+        # Timestamps are appended in monotonic order, so each deque is always sorted:
+        # the oldest request is at index 0 and expired entries form a prefix.
+        self._states: dict[str, _KeyState] = {}
+        # key -> (shared wake timer, futures of the coroutines waiting on it)
+        self._wake: dict[str, tuple[asyncio.TimerHandle, list[asyncio.Future]]] = {}
+        # Monotonic clock for all rate limit bookkeeping: immune to NTP slew/wallclock
+        # jumps and the same clock the event loop uses. Bound once to skip the module
+        # attribute lookup on every call. Wallclock is only used for epoch header math.
+        self._now: Callable[[], float] = time.monotonic
+        # Cached model_dump of config.dynamic_adjustments for get_stats. Invalidated
+        # (set to None) wherever an adjustment field is written; adjustments change
+        # rarely while stats may be polled frequently.
+        self._adjustments_dump: Optional[dict[str, Any]] = None
+
+        # Statistics. Queue size and request rate are maintained incrementally
+        # at record/cleanup time so get_stats never walks the per-key windows:
+        # _tracked counts timestamps currently held across all windows, and
+        # _rate_ema smooths the instantaneous rate of recorded requests.
+        self._tracked: int = 0
+        self._rate_ema: float = 0.0
+        self._last_record: Optional[float] = None
         self.total_requests: int = 0
         self.total_wait_time: float = 0
         self.max_wait_time: float = 0
@@ -71,6 +143,51 @@ class RateLimiter:
             if self.config.burst_size < self.config.max_requests:
                 self.config.burst_size = self.config.max_requests
 
+        # The strategy never changes after construction, so bind the strategy-specific
+        # implementations once instead of re-branching on every acquire.
+        if self.config.strategy == RateLimitStrategy.BURST:
+            self._cleanup_old_requests = self._cleanup_window_burst
+            self._should_wait = self._should_wait_burst
+            self.calculate_wait_time = self._calculate_wait_time_burst
+            self._record_request = self._record_request_burst
+        elif self.config.strategy == RateLimitStrategy.ADAPTIVE:
+            self._cleanup_old_requests = self._cleanup_window
+            self._should_wait = self._should_wait_adaptive
+            self.calculate_wait_time = self._calculate_wait_time_adaptive
+            self._record_request = self._record_request_window
+        else:  # STRICT
+            self._cleanup_old_requests = self._cleanup_window
+            self._should_wait = self._should_wait_strict
+            self.calculate_wait_time = self._calculate_wait_time_strict
+            self._record_request = self._record_request_window
+
+    def _window_maxlen(self) -> int:
+        """Bound for a per-key request window: the limit plus a little headroom"""
+        return self.config.max_requests + max(16, self.config.max_requests // 8)
+
+    def _burst_maxlen(self) -> int:
+        """Bound for a per-key burst window"""
+        burst_size = self.config.burst_size or self.config.max_requests
+        return burst_size + max(16, burst_size // 8)
+
+    # Snapshot mappings over the consolidated per-key state, kept for
+    # introspection (and the tests): the deques are the live objects, only the
+    # outer dict is rebuilt per access.
+    @property
+    def requests(self) -> dict[str, 'deque[float]']:
+        """Per-key request timestamp windows"""
+        return {key: state.window for key, state in self._states.items()}
+
+    @property
+    def burst_requests(self) -> dict[str, 'deque[float]']:
+        """Per-key burst timestamp windows"""
+        return {key: state.burst for key, state in self._states.items()}
+
+    @property
+    def wait_times(self) -> dict[str, float]:
+        """Per-key accumulated wait times"""
+        return {key: state.wait_time for key, state in self._states.items()}
+
     async def acquire(self, key: str = 'default') -> None:
         """
         Acquire permission to make a request, waiting if necessary.
@@ -78,51 +195,122 @@ class RateLimiter:
         Args:
             key: The key to rate limit on. Different keys have independent rate limits.
         """
-        async with self._lock:
-            # Initialize request lists for this key if they don't exist
-            if key not in self.requests:
-                self.requests[key] = []
-            if key not in self.burst_requests:
-                self.burst_requests[key] = []
-            if key not in self.wait_times:
-                self.wait_times[key] = 0.0
-
-            # Get current time and clean up old requests (use event loop's monotonic clock)
-            now = asyncio.get_event_loop().time()
+        self._init_key(key)
+
+        # asyncio is single-threaded and everything between the capacity check and
+        # the record below is synchronous, so each pass through the loop is atomic
+        # on the event loop: no lock is needed to keep check-then-record safe. Any
+        # new await added between them would break that invariant.
+        while True:
+            # Get current time and clean up old requests (monotonic clock)
+            now = self._now()
             self._cleanup_old_requests(now, key)
 
-            # Check if we should wait before recording the new request
-            if self._should_wait(now, key):
-                wait_time = self.calculate_wait_time(now, key)
-                if wait_time > 0:
-                    logger.debug(
-                        f'Rate limit reached for key {key}, waiting for {wait_time:.2f} seconds'
-                    )
-
-                    # Release the lock while waiting
-                    self._lock.release()
-                    try:
-                        start_wait = asyncio.get_event_loop().time()
-                        await asyncio.sleep(wait_time)
-                        actual_wait = asyncio.get_event_loop().time() - start_wait
-
-                        # Only update wait times after we've actually waited
-                        self.wait_times[key] += actual_wait  # Accumulate wait time for this key
-                        self.total_wait_time += actual_wait  # Accumulate total wait time
-                        self.max_wait_time = max(self.max_wait_time, actual_wait)
-                        self.rate_limit_hits += 1
-                        self.last_rate_limit_hit = now
-                    finally:
-                        await self._lock.acquire()
-
-                    # Get new time after waiting
-                    now = asyncio.get_event_loop().time()
-
-                    # Clean up old requests again after waiting
-                    self._cleanup_old_requests(now, key)
-
-            # Record the request
-            self._record_request(now, key)
+            # Record the request immediately if there's capacity
+            if not self._should_wait(now, key):
+                self._record_request(now, key)
+                return
+
+            wait_time = self.calculate_wait_time(now, key)
+            if wait_time <= 0:
+                self._record_request(now, key)
+                return
+
+            logger.debug(
+                'Rate limit reached for key %s, waiting for %.2f seconds', key, wait_time
+            )
+
+            # Wait, then loop around to re-check capacity; other coroutines (and
+            # other keys) proceed freely in the meantime.
+            start_wait = self._now()
+            await self._wait_for_slot(key, wait_time)
+            actual_wait = self._now() - start_wait
+
+            # Only update wait times after we've actually waited. The key can
+            # vanish mid-wait despite _prune_idle_keys skipping keys with
+            # pending waiters: a sweep may run between our wake-up callback
+            # (which clears the _wake entry) and this coroutine resuming.
+            state = self._states.get(key)
+            if state is None:
+                self._init_key(key)
+                state = self._states[key]
+            state.wait_time += actual_wait  # Accumulate wait time for this key
+            self.total_wait_time += actual_wait  # Accumulate total wait time
+            self.max_wait_time = max(self.max_wait_time, actual_wait)
+            self.rate_limit_hits += 1
+            self.last_rate_limit_hit = now
+
+    async def _wait_for_slot(self, key: str, wait_time: float) -> None:
+        """Wait until capacity may be available for a key.
+
+        Concurrent waiters on the same key share one loop.call_later timer, so a
+        burst of N blocked callers costs one timer handle instead of N
+        independent sleeps and N separate wakeups. Each waiter still awaits its
+        own future, so cancelling one waiter never propagates to the others. The
+        timer fires at the earliest deadline any waiter asked for: a waiter that
+        needed longer simply re-checks capacity and waits again.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        entry = self._wake.get(key)
+        if entry is not None and entry[0].when() <= loop.time() + wait_time:
+            entry[1].append(future)
+        else:
+            if entry is not None:
+                # This waiter's deadline is earlier than the scheduled timer:
+                # move everyone onto a timer at the earlier deadline.
+                entry[0].cancel()
+                futures = entry[1]
+                futures.append(future)
+            else:
+                futures = [future]
+            timer = loop.call_later(wait_time, self._resolve_wake, key)
+            self._wake[key] = (timer, futures)
+        await future
+
+    def _resolve_wake(self, key: str) -> None:
+        """Timer callback: wake every coroutine still waiting on this key"""
+        entry = self._wake.pop(key, None)
+        if entry is None:
+            return
+        for future in entry[1]:
+            # A future may already be cancelled if its waiter was cancelled
+            if not future.done():
+                future.set_result(None)
+
+    def _init_key(self, key: str) -> None:
+        """Initialize per-key state on first use.
+
+        maxlen bounds peak memory per key: _should_wait blocks appends at capacity
+        anyway, so the cap only guards against pathological growth.
+        """
+        if key not in self._states:
+            if len(self._states) >= IDLE_KEY_SWEEP_THRESHOLD:
+                self._prune_idle_keys()
+            self._states[key] = _KeyState(self._window_maxlen(), self._burst_maxlen())
+
+    def _prune_idle_keys(self) -> None:
+        """Drop per-key state whose windows have fully expired.
+
+        A long-running service acquiring on many distinct keys (per-user,
+        per-endpoint, ...) would otherwise grow the state table without bound.
+        A key is idle once every timestamp in its windows has aged out and no
+        coroutine is blocked in acquire() on it (waits can outlast the window,
+        e.g. under Retry-After directives); its accumulated per-key wait time
+        is dropped with it, while the aggregate statistics are unaffected.
+        """
+        now = self._now()
+        idle = []
+        for key, state in self._states.items():
+            if key in self._wake:
+                continue  # a blocked waiter still needs this key's state
+            self._cleanup_old_requests(now, key)
+            if not state.window and not state.burst:
+                idle.append(key)
+        for key in idle:
+            del self._states[key]
+        if idle:
+            logger.debug('Pruned %d idle rate limit key(s)', len(idle))
 
     def _check_rate_limit_expiry(self, now: float) -> None:
         """Check if rate limit hit tracking should be reset due to time passing"""
@@ -130,7 +318,7 @@ class RateLimiter:
             # If it's been long enough since the last rate limit hit, reset tracking
             if now - self.last_rate_limit_hit > RATE_LIMIT_EXPIRY_SECONDS:
                 logger.info(
-                    f'Rate limit hit tracking expired after {RATE_LIMIT_EXPIRY_SECONDS} seconds'
+                    'Rate limit hit tracking expired after %s seconds', RATE_LIMIT_EXPIRY_SECONDS
                 )
                 self.last_rate_limit_hit = None
 
@@ -144,9 +332,11 @@ class RateLimiter:
                         self.config.dynamic_adjustments.adaptive_multiplier = (
                             DEFAULT_ADAPTIVE_MULTIPLIER
                         )
+                        self._adjustments_dump = None
                         logger.info(
-                            'Resetting adaptive multiplier from '
-                            f'{old_multiplier:.2f} to {DEFAULT_ADAPTIVE_MULTIPLIER:.2f}'
+                            'Resetting adaptive multiplier from %.2f to %.2f',
+                            old_multiplier,
+                            DEFAULT_ADAPTIVE_MULTIPLIER,
                         )
 
     def update_from_response(self, response: Any) -> None:
@@ -167,8 +357,9 @@ class RateLimiter:
         if self.config.extract_headers_callback is not None:
             headers = self.config.extract_headers_callback(response)
         # Otherwise try to extract headers directly
+        # (_process_rate_limit_headers normalizes the keys, so pass them through as-is)
         elif hasattr(response, 'headers'):
-            headers = {k.lower(): v for k, v in response.headers.items()}
+            headers = response.headers
 
         self._process_rate_limit_headers(headers)
 
@@ -180,7 +371,7 @@ class RateLimiter:
             error: The error object
         """
         # Record this as a rate limit hit for all strategies
-        now = time.time()
+        now = self._now()
         self.rate_limit_hits += 1
         self.last_rate_limit_hit = now
 
@@ -192,27 +383,28 @@ class RateLimiter:
                 current_multiplier * ADAPTIVE_BACKOFF_FACTOR, MAX_ADAPTIVE_MULTIPLIER
             )
             self.config.dynamic_adjustments.adaptive_multiplier = new_multiplier
+            self._adjustments_dump = None
             logger.info(
-                'Rate limit hit, increasing wait multiplier to '
-                f'{new_multiplier:.2f} seconds per excess request'
+                'Rate limit hit, increasing wait multiplier to %.2f seconds per excess request',
+                new_multiplier,
             )
 
         # Try to extract headers from the error
         headers = {}
 
         # Extract from response attribute if it exists
+        # (_process_rate_limit_headers normalizes the keys, so pass them through as-is)
         if hasattr(error, 'response') and hasattr(error.response, 'headers'):
-            headers = {k.lower(): v for k, v in error.response.headers.items()}
+            headers = error.response.headers
 
         # Extract from headers attribute if it exists
         elif hasattr(error, 'headers'):
-            headers = {k.lower(): v for k, v in error.headers.items()}
+            headers = error.headers
 
         # Extract from string representation as last resort
         else:
-            error_str = str(error)
             # Look for common patterns like "retry after 30 seconds"
-            retry_match = re.search(r'retry after (\d+)', error_str.lower())
+            retry_match = RETRY_AFTER_MESSAGE_PATTERN.search(str(error))
             if retry_match:
                 headers['retry-after'] = retry_match.group(1)
 
@@ -225,299 +417,373 @@ class RateLimiter:
         Args:
             headers: The response headers
         """
-        now = time.time()
+        now = self._now()
+        # Reset headers may carry epoch timestamps, which only make sense against wallclock
+        wall_now = time.time()
         has_updated = False
 
-        # Normalize header keys to lowercase
+        # Normalize header keys to lowercase (the single place this happens)
         headers = {k.lower(): v for k, v in headers.items()}
 
         # Extract rate limit information
         reset_time = None
         limit = None
         remaining = None
-        retry_after = None
 
-        # Check for Retry-After header (direct seconds to wait)
-        if 'retry-after' in headers:
-            try:
-                retry_after = int(headers['retry-after'])
-                logger.info(f'Found Retry-After header: {retry_after} seconds')
+        # Visit only the known rate limit headers that are actually present: dict-view
+        # intersection runs in C and is O(min of the two sizes)
+        for header in _HEADER_CATEGORY.keys() & headers.keys():
+            category = _HEADER_CATEGORY[header]
+
+            # Extract numeric value. Retry-After style headers may legitimately
+            # carry an HTTP-date; the regex fallback would extract its
+            # day-of-month as a bogus wait, so accept only pure integers there.
+            raw = headers[header]
+            if category == 'seconds':
+                text = raw if isinstance(raw, str) else str(raw)
+                value = int(text) if text.isdigit() else None
+            else:
+                value = _parse_int(raw)
+            if value is None:
+                continue
+
+            if category == 'reset':
+                # Handle both epoch timestamps and seconds-from-now
+                if (
+                    value > wall_now + 3600
+                ):  # If it's more than an hour in the future, it's likely an epoch
+                    reset_time = value
+                else:
+                    reset_time = wall_now + value
+            elif category == 'limit':
+                limit = value
+            elif category == 'remaining':
+                remaining = value
+            else:  # 'seconds': a Retry-After style directive (direct seconds to wait)
+                logger.info('Found Retry-After header: %s seconds', value)
                 has_updated = True
 
                 # Record this adaptation
-                self.config.dynamic_adjustments.retry_after = retry_after
+                self.config.dynamic_adjustments.retry_after = value
                 self.config.dynamic_adjustments.retry_after_timestamp = now
-            except (ValueError, TypeError):
-                pass
-
-        # Check for rate limit headers
-        for header in RATE_LIMIT_HEADERS:
-            if header in headers:
-                value = headers[header]
-                # Extract numeric value
-                match = HEADER_VALUE_PATTERN.search(str(value))
-                if match:
-                    value = int(match.group(1))
-
-                    if 'reset' in header:
-                        # Handle both epoch timestamps and seconds-from-now
-                        if (
-                            value > now + 3600
-                        ):  # If it's more than an hour in the future, it's likely an epoch
-                            reset_time = value
-                        else:
-                            reset_time = now + value
-                    elif 'limit' in header and 'remaining' not in header:
-                        limit = value
-                    elif 'remaining' in header:
-                        remaining = value
-
-        # Update time window based on reset time
-        if reset_time is not None:
-            time_until_reset = max([0, reset_time - now])
-            if time_until_reset > 0:
-                logger.info(
-                    f'Updating time window to {time_until_reset:.1f} seconds based on reset header'
-                )
-                self.config.time_window = time_until_reset
-                has_updated = True
+                self._adjustments_dump = None
 
-                # Record this adaptation
-                self.config.dynamic_adjustments.time_window = time_until_reset
-                self.config.dynamic_adjustments.time_window_timestamp = now
-
-        # Update rate limit based on limit header
+        if reset_time is not None:
+            has_updated |= self._apply_reset(reset_time, now, wall_now)
         if limit is not None:
-            logger.info(f'Updating max requests to {limit} based on limit header')
-            self.config.max_requests = limit
-            has_updated = True
-
-            # Record this adaptation
-            self.config.dynamic_adjustments.max_requests = limit
-            self.config.dynamic_adjustments.max_requests_timestamp = now
-
-        # Force wait if we know remaining is 0 or very low
-        if remaining is not None and remaining <= 5 and reset_time is not None:
-            time_until_reset = max([0, reset_time - now])
-            if time_until_reset > 0:
-                logger.warning(
-                    'Only {remaining} requests remaining, waiting for reset in '
-                    f'{time_until_reset:.1f} seconds'
-                )
-                # Implemented in the calling code
-
-                # Record this situation
-                self.config.dynamic_adjustments.remaining = remaining
-                self.config.dynamic_adjustments.remaining_timestamp = now
+            has_updated |= self._apply_limit(limit, now)
+        if remaining is not None:
+            self._apply_remaining(remaining, reset_time, now, wall_now)
 
         # Set last update time if any adaptation happened
         if has_updated:
             self.last_dynamic_update = now
 
-    def _cleanup_old_requests(self, now: float, key: str) -> None:
+    def _apply_reset(self, reset_time: float, now: float, wall_now: float) -> bool:
+        """Update the time window from a reset header; returns whether anything changed"""
+        time_until_reset = max([0, reset_time - wall_now])
+        if time_until_reset <= 0:
+            return False
+        logger.info(
+            'Updating time window to %.1f seconds based on reset header', time_until_reset
+        )
+        self.config.time_window = time_until_reset
+
+        # Record this adaptation
+        self.config.dynamic_adjustments.time_window = time_until_reset
+        self.config.dynamic_adjustments.time_window_timestamp = now
+        self._adjustments_dump = None
+        return True
+
+    def _apply_limit(self, limit: int, now: float) -> bool:
+        """Update max requests from a limit header; returns whether anything changed"""
+        logger.info('Updating max requests to %s based on limit header', limit)
+        self.config.max_requests = limit
+
+        # Grow any existing windows whose bound the new limit no longer fits, so the
+        # maxlen cap never silently drops timestamps under the raised limit
+        new_maxlen = self._window_maxlen()
+        for state in self._states.values():
+            window = state.window
+            if window.maxlen is not None and window.maxlen < new_maxlen:
+                state.window = deque(window, maxlen=new_maxlen)
+
+        # Record this adaptation
+        self.config.dynamic_adjustments.max_requests = limit
+        self.config.dynamic_adjustments.max_requests_timestamp = now
+        self._adjustments_dump = None
+        return True
+
+    def _apply_remaining(
+        self, remaining: int, reset_time: Optional[float], now: float, wall_now: float
+    ) -> None:
+        """Record a low remaining-requests count (the caller enforces the wait)"""
+        if remaining > 5 or reset_time is None:
+            return
+        time_until_reset = max([0, reset_time - wall_now])
+        if time_until_reset > 0:
+            logger.warning(
+                'Only %s requests remaining, waiting for reset in %.1f seconds',
+                remaining,
+                time_until_reset,
+            )
+            # Implemented in the calling code
+
+            # Record this situation
+            self.config.dynamic_adjustments.remaining = remaining
+            self.config.dynamic_adjustments.remaining_timestamp = now
+            self._adjustments_dump = None
+
+    def _cleanup_window(self, now: float, key: str) -> None:
         """Remove requests older than the time window"""
-        if key in self.requests:
+        state = self._states.get(key)
+        if state is not None:
             window_start = now - self.config.time_window
-            # Keep length variable for potential future metrics
-            _old_count = len(self.requests[key])
-            self.requests[key] = [
-                req_time for req_time in self.requests[key] if req_time > window_start
-            ]
+            # Timestamps are sorted, so expired entries form a prefix: pop them in
+            # O(expired) instead of rebuilding the whole container per call.
+            requests = state.window
+            popleft = requests.popleft
+            before = len(requests)
+            while requests and requests[0] <= window_start:
+                popleft()
+            self._tracked -= before - len(requests)
 
             # Don't reset wait times during cleanup.
 
-        if key in self.burst_requests and self.config.strategy == RateLimitStrategy.BURST:
-            burst_window_start = now - self.config.burst_window
-            self.burst_requests[key] = [
-                req_time for req_time in self.burst_requests[key] if req_time > burst_window_start
-            ]
+    def _cleanup_window_burst(self, now: float, key: str) -> None:
+        """Remove requests older than the time window and the burst window"""
+        self._cleanup_window(now, key)
 
-    def _should_wait(self, now: float, key: str) -> bool:
-        """Determine if we need to wait based on the current strategy"""
-        if key not in self.requests:
+        state = self._states.get(key)
+        if state is not None:
+            burst_window_start = now - self.config.burst_window
+            burst_requests = state.burst
+            popleft = burst_requests.popleft
+            while burst_requests and burst_requests[0] <= burst_window_start:
+                popleft()
+
+    def _should_wait_strict(self, now: float, key: str) -> bool:
+        """Determine if we need to wait (STRICT strategy)"""
+        state = self._states.get(key)
+        if state is None:
             return False
 
         # Do not force waiting solely due to a recent rate limit hit; client handles backoff
 
-        if self.config.strategy == RateLimitStrategy.STRICT:
-            # Count only requests within the time window
-            window_start = now - self.config.time_window
-            recent_requests = [req for req in self.requests[key] if req > window_start]
-            # Wait if adding this request would exceed the limit
-            if len(recent_requests) + 1 > self.config.max_requests:
-                # Calculate wait time based on the oldest request in the window
-                oldest_request = min(recent_requests)
-                wait_time = max([0, oldest_request + self.config.time_window - now])
-                if wait_time > 0:
-                    return True
+        # After cleanup every remaining timestamp is within its window, so counting is
+        # len() and the oldest in-window request is at index 0 - no filtering scans.
+        self._cleanup_old_requests(now, key)
+
+        config = self.config
+        recent_requests = state.window
+        # Wait if adding this request would exceed the limit
+        if len(recent_requests) + 1 > config.max_requests:
+            # Calculate wait time based on the oldest request in the window
+            oldest_request = recent_requests[0]
+            wait_time = max([0, oldest_request + config.time_window - now])
+            if wait_time > 0:
+                return True
+        return False
+
+    def _should_wait_burst(self, now: float, key: str) -> bool:
+        """Determine if we need to wait (BURST strategy)"""
+        state = self._states.get(key)
+        if state is None:
             return False
 
-        elif self.config.strategy == RateLimitStrategy.BURST:
-            if key not in self.burst_requests:
-                self.burst_requests[key] = []
+        self._cleanup_old_requests(now, key)
 
-            # Count requests in both windows
-            window_start = now - self.config.time_window
-            burst_window_start = now - self.config.burst_window
+        config = self.config
+        recent_requests = state.window
+        recent_burst_requests = state.burst
 
-            recent_requests = [req for req in self.requests[key] if req > window_start]
-            recent_burst_requests = [
-                req for req in self.burst_requests[key] if req > burst_window_start
-            ]
-
-            # If we haven't exceeded the burst limit, allow the request
-            if len(recent_burst_requests) + 1 <= self.config.burst_size:
-                return False
-
-            # If we've exceeded the burst limit, fall back to regular rate limiting
-            if len(recent_requests) + 1 > self.config.max_requests:
-                # Calculate wait time based on the oldest request in the window
-                oldest_request = min(recent_requests)
-                wait_time = max([0, oldest_request + self.config.time_window - now])
-                if wait_time > 0:
-                    return True
+        # If we haven't exceeded the burst limit, allow the request
+        if len(recent_burst_requests) + 1 <= config.burst_size:
             return False
 
-        elif self.config.strategy == RateLimitStrategy.ADAPTIVE:
-            # Get threshold based on past rate limit hits
-            threshold_multiplier = 1.0
-
-            # If we've hit rate limits recently, be more conservative
-            if self.last_rate_limit_hit is not None and now - self.last_rate_limit_hit < 60:
-                threshold_multiplier = 0.8  # Lower threshold to 80% of max
+        # If we've exceeded the burst limit, fall back to regular rate limiting
+        if len(recent_requests) + 1 > config.max_requests:
+            # Calculate wait time based on the oldest request in the window
+            oldest_request = recent_requests[0]
+            wait_time = max([0, oldest_request + config.time_window - now])
+            if wait_time > 0:
+                return True
+        return False
 
-            # Count only requests within the time window
-            window_start = now - self.config.time_window
-            recent_requests = [req for req in self.requests[key] if req > window_start]
-
-            # In adaptive mode, we still enforce the absolute limit
-            if len(recent_requests) + 1 > self.config.max_requests:
-                # Calculate wait time based on the oldest request in the window
-                oldest_request = min(recent_requests)
-                wait_time = max([0, oldest_request + self.config.time_window - now])
-                if wait_time > 0:
-                    return True
-
-            # But we also start slowing down as we approach the limit
-            if len(recent_requests) + 1 > (self.config.max_requests * threshold_multiplier):
-                # Calculate wait time based on the oldest request in the window
-                oldest_request = min(recent_requests)
-                wait_time = max([0, oldest_request + self.config.time_window - now])
-                if wait_time > 0:
-                    return True
+    def _should_wait_adaptive(self, now: float, key: str) -> bool:
+        """Determine if we need to wait (ADAPTIVE strategy)"""
+        state = self._states.get(key)
+        if state is None:
             return False
 
+        self._cleanup_old_requests(now, key)
+
+        # Get threshold based on past rate limit hits
+        threshold_multiplier = 1.0
+
+        # If we've hit rate limits recently, be more conservative
+        if self.last_rate_limit_hit is not None and now - self.last_rate_limit_hit < 60:
+            threshold_multiplier = 0.8  # Lower threshold to 80% of max
+
+        config = self.config
+        max_requests = config.max_requests
+        time_window = config.time_window
+        recent_requests = state.window
+
+        # In adaptive mode, we still enforce the absolute limit
+        if len(recent_requests) + 1 > max_requests:
+            # Calculate wait time based on the oldest request in the window
+            oldest_request = recent_requests[0]
+            wait_time = max([0, oldest_request + time_window - now])
+            if wait_time > 0:
+                return True
+
+        # But we also start slowing down as we approach the limit (an empty
+        # window can still trip this threshold when max_requests is small)
+        if recent_requests and len(recent_requests) + 1 > (max_requests * threshold_multiplier):
+            # Calculate wait time based on the oldest request in the window
+            oldest_request = recent_requests[0]
+            wait_time = max([0, oldest_request + time_window - now])
+            if wait_time > 0:
+                return True
         return False
 
-    def calculate_wait_time(self, now: float, key: str = 'default') -> float:
-        """Calculate how long to wait based on the current strategy"""
-        if key not in self.requests or not self.requests[key]:
+    def _calculate_wait_time_strict(self, now: float, key: str = 'default') -> float:
+        """Calculate how long to wait (STRICT strategy)"""
+        recent_requests = self._trimmed_window(now, key)
+        if not recent_requests:
             return 0
 
-        if self.config.strategy == RateLimitStrategy.STRICT:
-            # Count requests within the time window
-            window_start = now - self.config.time_window
-            recent_requests = [req for req in self.requests[key] if req > window_start]
+        config = self.config
+        # Only wait if we've exceeded the rate limit
+        if len(recent_requests) + 1 > config.max_requests:
+            oldest_request = recent_requests[0]
+            base_wait = max([0, oldest_request + config.time_window - now])
+            return max(base_wait, 0.5)  # Always wait at least 0.5 seconds when rate limited
+        return 0
 
-            # Only wait if we've exceeded the rate limit
-            if len(recent_requests) + 1 > self.config.max_requests:
-                oldest_request = min(recent_requests)
-                base_wait = max([0, oldest_request + self.config.time_window - now])
-                return max(base_wait, 0.5)  # Always wait at least 0.5 seconds when rate limited
+    def _calculate_wait_time_burst(self, now: float, key: str = 'default') -> float:
+        """Calculate how long to wait (BURST strategy)"""
+        recent_requests = self._trimmed_window(now, key)
+        if not recent_requests:
             return 0
 
-        elif self.config.strategy == RateLimitStrategy.BURST:
-            # Count requests in both windows
-            window_start = now - self.config.time_window
-            burst_window_start = now - self.config.burst_window
-
-            recent_requests = [req for req in self.requests[key] if req > window_start]
-            recent_burst_requests = [
-                req for req in self.burst_requests[key] if req > burst_window_start
-            ]
-
-            # If we've exceeded the burst limit, wait based on the regular rate limit
-            if len(recent_burst_requests) + 1 > self.config.burst_size:
-                if len(recent_requests) + 1 > self.config.max_requests:
-                    oldest_request = min(recent_requests)
-                    base_wait = max([0, oldest_request + self.config.time_window - now])
-                    return max(base_wait, 0.5)  # Always wait at least 0.5 seconds when rate limited
-                return 0
-
-            # If we're approaching the burst limit, start waiting
-            if len(recent_burst_requests) + 1 > self.config.burst_size * 0.8:  # 80% of burst limit
-                if recent_burst_requests:
-                    oldest_burst = min(recent_burst_requests)
-                    burst_wait = max([0, oldest_burst + self.config.burst_window - now])
-                    return max(
-                        burst_wait, 0.5
-                    )  # Always wait at least 0.5 seconds when rate limited
+        config = self.config
+        recent_burst_requests = self._states[key].burst
 
+        # If we've exceeded the burst limit, wait based on the regular rate limit
+        if len(recent_burst_requests) + 1 > config.burst_size:
+            if len(recent_requests) + 1 > config.max_requests:
+                oldest_request = recent_requests[0]
+                base_wait = max([0, oldest_request + config.time_window - now])
+                return max(base_wait, 0.5)  # Always wait at least 0.5 seconds when rate limited
             return 0
 
-        elif self.config.strategy == RateLimitStrategy.ADAPTIVE:
-            # If we've hit a rate limit recently, always wait at least 0.5 seconds
-            if self.last_rate_limit_hit is not None and now - self.last_rate_limit_hit < 60:
-                return 0.5  # Minimum wait time after rate limit hit
-
-            # First: Check if we have a retry-after directive that's still valid
-            if (
-                self.config.dynamic_adjustments.retry_after is not None
-                and self.config.dynamic_adjustments.retry_after_timestamp is not None
-            ):
-                retry_after = self.config.dynamic_adjustments.retry_after
-                retry_timestamp = self.config.dynamic_adjustments.retry_after_timestamp
-                # Use this if it's not too old (within last minute)
-                if now - retry_timestamp < 60:
-                    adjusted_retry = retry_after - (now - retry_timestamp)
-                    if adjusted_retry > 0:
-                        return max(
-                            adjusted_retry, 0.5
-                        )  # Always wait at least 0.5 seconds when rate limited
-
-            # Get current adaptive multiplier (with default if not set)
-            multiplier = self.config.dynamic_adjustments.adaptive_multiplier
-
-            # Count only requests within the time window
-            window_start = now - self.config.time_window
-            recent_requests = [req for req in self.requests[key] if req > window_start]
-
-            # Only wait if we've exceeded the rate limit
-            if len(recent_requests) + 1 > self.config.max_requests:
-                oldest_request = min(recent_requests)
-                base_wait = max([0, oldest_request + self.config.time_window - now])
-                excess = len(recent_requests) + 1 - self.config.max_requests
-                return max(
-                    base_wait + excess * multiplier, 0.5
-                )  # Always wait at least 0.5 seconds when rate limited
-
-            # For adaptive strategy, start waiting earlier but with smaller increments
-            if len(recent_requests) + 1 > self.config.max_requests * 0.8:  # 80% of limit
-                oldest_request = min(recent_requests)
-                base_wait = max([0, oldest_request + self.config.time_window - now])
-                excess = len(recent_requests) + 1 - int(self.config.max_requests * 0.8)
-                return max(
-                    base_wait * 0.5 + excess * multiplier * 0.5, 0.5
-                )  # Always wait at least 0.5 seconds when rate limited
+        # If we're approaching the burst limit, start waiting
+        if len(recent_burst_requests) + 1 > config.burst_size * 0.8:  # 80% of burst limit
+            if recent_burst_requests:
+                oldest_burst = recent_burst_requests[0]
+                burst_wait = max([0, oldest_burst + config.burst_window - now])
+                return max(burst_wait, 0.5)  # Always wait at least 0.5 seconds when rate limited
 
+        return 0
+
+    def _calculate_wait_time_adaptive(self, now: float, key: str = 'default') -> float:
+        """Calculate how long to wait (ADAPTIVE strategy)"""
+        recent_requests = self._trimmed_window(now, key)
+        if not recent_requests:
             return 0
 
+        jitter = self.config.jitter
+
+        # If we've hit a rate limit recently, always wait at least 0.5 seconds
+        if self.last_rate_limit_hit is not None and now - self.last_rate_limit_hit < 60:
+            # Minimum wait time after rate limit hit (jittered so concurrent
+            # workers don't all retry at the same instant)
+            return random.uniform(0.5, 0.75) if jitter else 0.5
+
+        # Batch-read the config and adjustment fields once: Pydantic attribute access
+        # is much slower than a local, and several are read multiple times below
+        config = self.config
+        adjustments = config.dynamic_adjustments
+        max_requests = config.max_requests
+        time_window = config.time_window
+
+        # First: Check if we have a retry-after directive that's still valid
+        retry_after = adjustments.retry_after
+        retry_timestamp = adjustments.retry_after_timestamp
+        if retry_after is not None and retry_timestamp is not None:
+            # Use this if it's not too old (within last minute)
+            if now - retry_timestamp < 60:
+                adjusted_retry = retry_after - (now - retry_timestamp)
+                if adjusted_retry > 0:
+                    # Always wait at least 0.5 seconds when rate limited; add up to
+                    # 10% jitter so waiters don't resynchronize when the server's
+                    # Retry-After window expires
+                    wait = max(adjusted_retry, 0.5)
+                    return wait + random.uniform(0, 0.1 * wait) if jitter else wait
+
+        # Get current adaptive multiplier (with default if not set)
+        multiplier = adjustments.adaptive_multiplier
+
+        # Only wait if we've exceeded the rate limit
+        if len(recent_requests) + 1 > max_requests:
+            oldest_request = recent_requests[0]
+            base_wait = max([0, oldest_request + time_window - now])
+            excess = len(recent_requests) + 1 - max_requests
+            # Always wait at least 0.5 seconds when rate limited; full jitter spreads
+            # simultaneous waiters across the retry window instead of re-syncing them
+            wait = max(base_wait + excess * multiplier, 0.5)
+            return random.uniform(wait, wait * 1.5) if jitter else wait
+
+        # For adaptive strategy, start waiting earlier but with smaller increments
+        if len(recent_requests) + 1 > max_requests * 0.8:  # 80% of limit
+            oldest_request = recent_requests[0]
+            base_wait = max([0, oldest_request + time_window - now])
+            excess = len(recent_requests) + 1 - int(max_requests * 0.8)
+            # Always wait at least 0.5 seconds when rate limited (jittered as above)
+            wait = max(base_wait * 0.5 + excess * multiplier * 0.5, 0.5)
+            return random.uniform(wait, wait * 1.5) if jitter else wait
+
         return 0
 
-    def _record_request(self, now: float, key: str) -> None:
+    def _trimmed_window(self, now: float, key: str) -> Optional['deque[float]']:
+        """Return the cleaned request window for a key, or None if there is nothing in it.
+
+        Callers outside acquire() (e.g. the client's retry path) may not have cleaned
+        up yet, so trim expired entries before relying on len() and index 0.
+        """
+        state = self._states.get(key)
+        if state is None or not state.window:
+            return None
+        self._cleanup_old_requests(now, key)
+        return state.window or None
+
+    def _record_request_window(self, now: float, key: str) -> None:
         """Record a new request"""
-        if key not in self.requests:
-            self.requests[key] = []
-        if key not in self.burst_requests:
-            self.burst_requests[key] = []
-        if key not in self.wait_times:
-            self.wait_times[key] = 0.0
-
-        self.requests[key].append(now)
-        if self.config.strategy == RateLimitStrategy.BURST:
-            self.burst_requests[key].append(now)
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = _KeyState(self._window_maxlen(), self._burst_maxlen())
+
+        window = state.window
+        if len(window) == window.maxlen:
+            self._tracked -= 1  # a full deque drops its oldest entry on append
+        window.append(now)
+        self._tracked += 1
         self.total_requests += 1
 
+        # Update the request-rate EMA from the spacing between recorded requests
+        last = self._last_record
+        if last is not None and now > last:
+            instant_rate = 60.0 / (now - last)  # requests per minute
+            self._rate_ema += RATE_EMA_ALPHA * (instant_rate - self._rate_ema)
+        self._last_record = now
+
+    def _record_request_burst(self, now: float, key: str) -> None:
+        """Record a new request in both the regular and burst windows"""
+        self._record_request_window(now, key)
+        self._states[key].burst.append(now)
+
     def reset_rate_limit_tracking(self) -> None:
         """
         Manually reset rate limit tracking.
@@ -532,51 +798,76 @@ class RateLimiter:
             old_multiplier = self.config.dynamic_adjustments.adaptive_multiplier
             if old_multiplier != DEFAULT_ADAPTIVE_MULTIPLIER:
                 logger.info(
-                    'Manually resetting adaptive multiplier from '
-                    f'{old_multiplier:.2f} to {DEFAULT_ADAPTIVE_MULTIPLIER:.2f}'
+                    'Manually resetting adaptive multiplier from %.2f to %.2f',
+                    old_multiplier,
+                    DEFAULT_ADAPTIVE_MULTIPLIER,
                 )
                 self.config.dynamic_adjustments.adaptive_multiplier = DEFAULT_ADAPTIVE_MULTIPLIER
+                self._adjustments_dump = None
 
         logger.info('Rate limit tracking manually reset')
 
     def get_stats(self) -> RateLimiterStats:
         """Get current rate limit statistics"""
-        now = time.time()
-        window_start = now - self.config.time_window
-
-        # Count recent requests across all keys
-        recent_requests = 0
-        total_requests = 0
-        for key in self.requests:
-            requests_in_window = [req for req in self.requests[key] if req > window_start]
-            recent_requests += len(requests_in_window)
-            total_requests += len(self.requests[key])
-
-        current_rate = recent_requests / (self.config.time_window / 60)  # requests per minute
-
-        # Use the accumulated total_wait_time instead of recalculating
-        stats = {
-            'total_requests': self.total_requests,
-            'total_wait_time': self.total_wait_time,  # Use the accumulated value
-            'max_wait_time': self.max_wait_time,
-            'current_rate': current_rate,
-            'current_queue_size': total_requests,  # Total number of requests across all keys
-            'rate_limit_hits': self.rate_limit_hits,
-        }
-
-        # Add dynamic adaptations if any
+        now = self._now()
+        # Internal stamps are monotonic, but the exported timestamp fields are
+        # documented as wallclock: shift them by the current monotonic-to-epoch
+        # offset at this export boundary.
+        wall_offset = time.time() - now
+
+        # Queue size and rate are maintained incrementally (see _record_request_window
+        # and _cleanup_window), so stats never walk the per-key windows. As before,
+        # the queue size includes entries that have expired but not yet been cleaned
+        # up by an acquire on their key; the rate is an EMA of the recorded request
+        # rate rather than an exact count over the current window.
+
+        # Add dynamic adaptations if any. The dump is cached until an adjustment
+        # field changes; hand out a shallow copy so callers can't mutate the cache.
+        dynamic_adjustments = None
         if self.last_dynamic_update is not None:
-            stats['last_dynamic_update'] = self.last_dynamic_update
-            stats['dynamic_adjustments'] = self.config.dynamic_adjustments.model_dump(
-                exclude_none=True
-            )
+            if self._adjustments_dump is None:
+                self._adjustments_dump = self.config.dynamic_adjustments.model_dump(
+                    exclude_none=True
+                )
+            dynamic_adjustments = dict(self._adjustments_dump)
+            for name in (
+                'retry_after_timestamp',
+                'time_window_timestamp',
+                'max_requests_timestamp',
+                'remaining_timestamp',
+            ):
+                timestamp = dynamic_adjustments.get(name)
+                if timestamp is not None:
+                    dynamic_adjustments[name] = timestamp + wall_offset
 
         # Add last rate limit hit if any
+        last_rate_limit_hit = None
+        time_since_last_rate_limit = None
+        rate_limit_expiry_in = None
         if self.last_rate_limit_hit is not None:
-            stats['last_rate_limit_hit'] = self.last_rate_limit_hit
-            stats['time_since_last_rate_limit'] = now - self.last_rate_limit_hit
-            stats['rate_limit_expiry_in'] = max(
-                0, RATE_LIMIT_EXPIRY_SECONDS - (now - self.last_rate_limit_hit)
+            time_since_last_rate_limit = now - self.last_rate_limit_hit
+            rate_limit_expiry_in = max(
+                0, RATE_LIMIT_EXPIRY_SECONDS - time_since_last_rate_limit
             )
+            last_rate_limit_hit = self.last_rate_limit_hit + wall_offset
 
-        return RateLimiterStats(**stats)
+        last_dynamic_update = None
+        if self.last_dynamic_update is not None:
+            last_dynamic_update = self.last_dynamic_update + wall_offset
+
+        # All values are produced by the limiter itself and known valid, so skip
+        # Pydantic validation with model_construct - get_stats may be polled
+        # frequently (e.g. from a metrics endpoint).
+        return RateLimiterStats.model_construct(
+            total_requests=self.total_requests,
+            total_wait_time=self.total_wait_time,  # Use the accumulated value
+            max_wait_time=self.max_wait_time,
+            current_rate=self._rate_ema,
+            current_queue_size=self._tracked,  # Total number of requests across all keys
+            rate_limit_hits=self.rate_limit_hits,
+            last_dynamic_update=last_dynamic_update,
+            dynamic_adjustments=dynamic_adjustments,
+            last_rate_limit_hit=last_rate_limit_hit,
+            time_since_last_rate_limit=time_since_last_rate_limit,
+            rate_limit_expiry_in=rate_limit_expiry_in,
+        )
@@ -59,11 +59,14 @@ def rate_limited(
             extract_headers_callback=extract_headers_callback,
         )
         limiter = RateLimiter(config)
+        # Bind the bound method once at decoration time so each call reads a
+        # closure cell instead of re-resolving the attribute per invocation
+        acquire = limiter.acquire
 
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> T:
             # Use the limiter's acquire method to handle rate limiting
-            await limiter.acquire()
+            await acquire()
             return await func(*args, **kwargs)
 
         # Add a reference to the limiter for stats and configuration
@@ -5,7 +5,7 @@ This module contains all the Pydantic models and enums used for
 rate limiting configuration and statistics.
 """
 
-from enum import Enum, auto
+from enum import IntEnum
 from typing import Any, Callable, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -17,12 +17,16 @@ ADAPTIVE_BACKOFF_FACTOR = 2.0  # How much to increase multiplier on rate limit h
 RATE_LIMIT_EXPIRY_SECONDS = 300  # Time after which rate limit hits are "forgotten" (5 minutes)
 
 
-class RateLimitStrategy(Enum):
-    """Different strategies for handling rate limits"""
+class RateLimitStrategy(IntEnum):
+    """Different strategies for handling rate limits.
 
-    STRICT = auto()  # Never exceed the rate limit
-    BURST = auto()  # Allow short bursts above the limit
-    ADAPTIVE = auto()  # Dynamically adjust based on API response
+    IntEnum so strategy comparisons are plain integer equality instead of
+    Enum.__eq__; the values match what auto() assigned historically.
+    """
+
+    STRICT = 1  # Never exceed the rate limit
+    BURST = 2  # Allow short bursts above the limit
+    ADAPTIVE = 3  # Dynamically adjust based on API response
 
 
 class DynamicAdjustments(BaseModel):
@@ -91,6 +95,11 @@ class RateLimitConfig(BaseModel):
     cooldown_period: Optional[int] = Field(
         None, description='Cooldown period after burst in seconds', ge=0
     )
+    jitter: bool = Field(
+        True,
+        description='Randomize adaptive wait times to avoid synchronized retries '
+        '(thundering herd) when many workers share a limit',
+    )
     extract_headers_callback: Optional[Callable[[Any], dict[str, str]]] = Field(
         None, description='Callback to extract rate limit info from responses'
     )
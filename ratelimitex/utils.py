@@ -5,10 +5,55 @@ This module provides helper functions that can be used independently
 of the rate limiter classes.
 """
 
-from typing import Any
+import re
+from functools import lru_cache
+from typing import Any, Optional
 
 from .exceptions import RateLimitExceeded
 
+# Error messages that identify a rate limit error. Matching is intentionally exact
+# (whole message, ignoring case) to avoid false positives on messages that merely
+# mention rate limiting.
+RATE_LIMIT_PHRASES = (
+    'rate limit exceeded',
+    'too many requests',
+    'quota exceeded',
+    'request was throttled',
+    'http 429',
+    'error 429',
+    'rate limit was hit',
+    'request throttling',
+    'rate exceeded',
+    'request limit exceeded',
+    'api limit exceeded',
+    'rate limiting exceeded',
+    'rate-limit exceeded',
+    'ratelimit exceeded',
+)
+
+# Compiled once so the check is a single case-insensitive pass over the message
+# instead of lowercasing a copy and comparing against each phrase in turn.
+_RATE_LIMIT_PHRASE_PATTERN = re.compile(
+    '|'.join(re.escape(phrase) for phrase in RATE_LIMIT_PHRASES), re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=256)
+def _class_verdict(cls: type) -> Optional[bool]:
+    """Class-level rate limit verdict, cached per exception type.
+
+    Callers typically raise the same handful of exception classes over and over
+    (especially across retries), so the subclass walk is worth memoizing. Returns
+    True only when the class alone settles the question; returns None - never
+    False - when inconclusive, because instance attributes and the message still
+    have to be inspected per error.
+    """
+    if issubclass(cls, RateLimitExceeded):
+        return True
+    if getattr(cls, 'status_code', None) == 429:
+        return True
+    return None
+
 
 def is_rate_limit_error(error: Any) -> bool:
     """
@@ -28,37 +73,20 @@ def is_rate_limit_error(error: Any) -> bool:
     Returns:
         bool: True if the error appears to be a rate limit error
     """
-    # Check for our custom exception first
-    if isinstance(error, RateLimitExceeded):
+    # Check the cached class-level verdict first (covers RateLimitExceeded
+    # subclasses and classes that define status_code = 429)
+    if _class_verdict(type(error)):
+        return True
+
+    # Check for status code directly on the error, then on error.response.
+    # getattr with a default probes each attribute once instead of the
+    # hasattr-then-load double lookup.
+    if getattr(error, 'status_code', None) == 429:
         return True
 
-    # Check for status code directly on the error
-    if hasattr(error, 'status_code') and error.status_code == 429:
+    response = getattr(error, 'response', None)
+    if response is not None and getattr(response, 'status_code', None) == 429:
         return True
 
-    # Check for status code on error.response
-    if hasattr(error, 'response') and hasattr(error.response, 'status_code'):
-        if error.response.status_code == 429:
-            return True
-
-    # Check error message for rate limit related phrases
-    error_msg = str(error).lower()
-    rate_limit_phrases = [
-        'rate limit exceeded',
-        'too many requests',
-        'quota exceeded',
-        'request was throttled',
-        'http 429',
-        'error 429',
-        'rate limit was hit',
-        'request throttling',
-        'rate exceeded',
-        'request limit exceeded',
-        'api limit exceeded',
-        'rate limiting exceeded',
-        'rate-limit exceeded',
-        'ratelimit exceeded',
-    ]
-
-    # Check for exact matches
-    return error_msg in rate_limit_phrases
+    # Check the error message for rate limit phrases (exact matches only)
+    return _RATE_LIMIT_PHRASE_PATTERN.fullmatch(str(error)) is not None
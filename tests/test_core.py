@@ -95,3 +95,127 @@ async def test_rate_limiter_different_keys():
     # Each key should only have its most recent request
     assert len(limiter.requests['key1']) == 1
     assert len(limiter.requests['key2']) == 1
+
+
+@pytest.mark.parametrize(
+    'message',
+    [
+        'Rate limit exceeded, retry after 30 seconds',
+        'Rate limit exceeded, Retry-After 30',
+        'Too many requests, try again in 30 seconds',
+        'Request throttled, reset in 30',
+    ],
+)
+def test_update_from_error_message_wait_hints(message):
+    """Test extracting wait hints from error messages without headers."""
+    limiter = RateLimiter(
+        RateLimitConfig(max_requests=5, time_window=10, strategy=RateLimitStrategy.ADAPTIVE)
+    )
+
+    # A bare exception has no headers or response, so only the message is parsed
+    limiter.update_from_error(Exception(message))
+
+    assert limiter.config.dynamic_adjustments.retry_after == 30
+    assert limiter.rate_limit_hits == 1
+
+
+def test_adaptive_wait_time_jitter():
+    """Test that the jitter flag controls randomization of adaptive waits."""
+
+    def make_limiter(jitter):
+        return RateLimiter(
+            RateLimitConfig(
+                max_requests=2,
+                time_window=10,
+                strategy=RateLimitStrategy.ADAPTIVE,
+                jitter=jitter,
+            )
+        )
+
+    plain = make_limiter(jitter=False)
+    jittered = make_limiter(jitter=True)
+
+    # Record identical timestamps in both limiters, past the limit
+    now = plain._now()
+    for limiter in (plain, jittered):
+        for _ in range(3):
+            limiter._record_request_window(now, 'default')
+
+    # Without jitter the wait is deterministic and respects the 0.5s floor
+    base = plain.calculate_wait_time(now)
+    assert base >= 0.5
+    assert plain.calculate_wait_time(now) == base
+
+    # With jitter the wait is randomized within [base, 1.5 * base]
+    waits = [jittered.calculate_wait_time(now) for _ in range(25)]
+    assert all(base <= wait <= base * 1.5 for wait in waits)
+    assert len(set(waits)) > 1
+
+    # The floor after a recent rate limit hit is 0.5s, jittered up to 0.75s
+    plain.last_rate_limit_hit = now
+    jittered.last_rate_limit_hit = now
+    assert plain.calculate_wait_time(now) == 0.5
+    waits = [jittered.calculate_wait_time(now) for _ in range(25)]
+    assert all(0.5 <= wait <= 0.75 for wait in waits)
+
+
+@pytest.mark.asyncio
+async def test_prune_idle_keys(monkeypatch):
+    """Test that idle keys are pruned once the state table grows large."""
+    monkeypatch.setattr('ratelimitex.core.IDLE_KEY_SWEEP_THRESHOLD', 3)
+    limiter = RateLimiter(RateLimitConfig(max_requests=5, time_window=1))
+
+    # Fill the table up to the sweep threshold, then let every window expire
+    for i in range(3):
+        await limiter.acquire(f'idle{i}')
+    await asyncio.sleep(1.1)
+
+    # A new key pushes the table past the threshold and triggers the sweep:
+    # the expired keys are dropped
+    await limiter.acquire('warm')
+    assert set(limiter.requests) == {'warm'}
+
+    # Reach the threshold again while the earlier keys are still within their
+    # windows - the next sweep must leave active keys alone
+    await limiter.acquire('other1')
+    await limiter.acquire('other2')
+    await limiter.acquire('fresh')
+    assert set(limiter.requests) == {'warm', 'other1', 'other2', 'fresh'}
+
+    # Aggregate stats stay consistent: pruned keys keep counting toward
+    # total_requests, while only live timestamps remain in the queue
+    assert limiter.total_requests == 7
+    stats = limiter.get_stats()
+    assert stats.total_requests == 7
+    assert stats.current_queue_size == 4
+
+
+@pytest.mark.asyncio
+async def test_prune_skips_keys_with_blocked_waiters(monkeypatch):
+    """Test that pruning never drops a key a coroutine is still waiting on."""
+    monkeypatch.setattr('ratelimitex.core.IDLE_KEY_SWEEP_THRESHOLD', 1)
+    limiter = RateLimiter(
+        RateLimitConfig(
+            max_requests=1, time_window=1, strategy=RateLimitStrategy.ADAPTIVE, jitter=False
+        )
+    )
+
+    # Make the next blocked acquire wait well past its window expiry
+    limiter.config.dynamic_adjustments.retry_after = 2
+    limiter.config.dynamic_adjustments.retry_after_timestamp = limiter._now()
+
+    await limiter.acquire('victim')
+    waiter = asyncio.create_task(limiter.acquire('victim'))
+
+    # The victim's window has expired, but the waiter is still blocked
+    await asyncio.sleep(1.2)
+    assert not waiter.done()
+
+    # A new key pushes the table past the threshold and sweeps mid-wait;
+    # the victim key must survive because its waiter still needs it
+    await limiter.acquire('other')
+    assert 'victim' in limiter.requests
+
+    # The waiter completes its acquire normally once the wait elapses
+    await waiter
+    assert limiter.total_requests == 3